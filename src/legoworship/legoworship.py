@@ -1,56 +1,216 @@
 """Main module."""
 
+import concurrent.futures
 import csv
+import functools
+import multiprocessing
 import os
 import shutil
+import unicodedata
 from pathlib import Path
-from string import Template
-from typing import ClassVar, Dict, List, Optional, Sequence, Type, TypeVar, Union
+from typing import (
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+import ahocorasick
 import attr
 from loguru import logger
 from pypinyin import lazy_pinyin
+from pypinyin.pinyin_dict import pinyin_dict
 
 # The default pinyin order for "祢" is "mí" first and then "nǐ", which is not
 # how we pronounce the character.
 PINYIN_ADJUSTMENTS = {ord("祢"): "nǐ,mí"}
 
+# Tone marks left as combining characters once a reading is decomposed (NFD).
+TONE_MARKS = str.maketrans({"\u0300": None, "\u0301": None, "\u0304": None, "\u030c": None})
+
+# Filenames use the common characters instead of the honorific "祢" and "祂".
+SEARCH_TITLE_TRANSLATION = str.maketrans({"祢": "你", "祂": "他"})
 
-SONG_PAGE_TEMPLATE = Template(
-    """---
+
+def _render_song_page(title: str, title_url: str, sheet_links: str, data_columns: str) -> str:
+    """Render the markdown page of a song with its sheets."""
+    return f"""---
 layout: song
-title: $title
-permalink: /songbook/$title_url
+title: {title}
+permalink: /songbook/{title_url}
 ---
 
 #### 歌谱
 
-{% include post-components/gallery.html
-    columns = $data_columns
+{{% include post-components/gallery.html
+    columns = {data_columns}
     full_width = true
-    images = "$sheet_links,"
-%}
+    images = "{sheet_links},"
+%}}
 
 
 """
-)
 
-SONG_PAGE_BLANK_TEMPLATE = Template(
-    """---
+
+def _render_blank_song_page(title: str, title_url: str) -> str:
+    """Render the markdown page of a song without any sheet."""
+    return f"""---
 layout: song
-title: $title
-permalink: /songbook/$title_url
+title: {title}
+permalink: /songbook/{title_url}
 ---
 
 抱歉，暂时还未收录这首歌的谱子。
 
 """
-)
+
+
+def _write_song_page(payload: Tuple[str, str, str, str, str]) -> str:
+    """Render and write a song page.
+
+    Args:
+        payload: the title, title url, sheet links, data columns and page directory
+            of the song, as built by `Song._page_payload`.
+
+    Returns:
+        The title of the song.
+    """
+    title, title_url, sheet_links, data_columns, page_dir = payload
+    with open(os.path.join(page_dir, f"{title}.md"), "w") as f:
+        f.write(_render_song_page(title, title_url, sheet_links, data_columns))
+    return title
+
 
 T = TypeVar("T", bound="Song")
 
 
-@attr.s(auto_attribs=True)
+def _iter_files(path: str) -> Iterator[Tuple[str, str, str]]:
+    """Recursively yield `(dirpath, filepath, filename)` for every file under `path`.
+
+    Unlike `os.walk`, the `DirEntry` objects from `os.scandir` are used directly,
+    so the file type comes from the cached directory entry instead of extra
+    `stat()` calls. Unreadable or missing directories are skipped, as `os.walk`
+    does.
+
+    Args:
+        path: the directory to walk through.
+
+    Yields:
+        The directory, the full path and the name of each file.
+    """
+    try:
+        scanner = os.scandir(path)
+    except OSError:
+        return
+    with scanner:
+        subdirs = []
+        for entry in scanner:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield path, entry.path, entry.name
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
+
+@functools.lru_cache(maxsize=None)
+def _fixed_pinyin(char: str) -> Optional[str]:
+    """Return the capitalized pinyin of a character that has only one reading.
+
+    Characters in `PINYIN_ADJUSTMENTS` count as having one reading, their first
+    adjusted one. Characters with several readings, or none, return None.
+
+    Args:
+        char: the character to look up.
+
+    Returns:
+        The pinyin, or None if the reading depends on the context.
+    """
+    code = ord(char)
+    if code in PINYIN_ADJUSTMENTS:
+        reading = PINYIN_ADJUSTMENTS[code].split(",")[0]
+    else:
+        readings: Optional[str] = pinyin_dict.get(code)
+        if readings is None or "," in readings:
+            return None
+        reading = readings
+    # Same as pypinyin's normal style: drop the tone, write "ü" as "v".
+    reading = unicodedata.normalize(
+        "NFC", unicodedata.normalize("NFD", reading).translate(TONE_MARKS)
+    )
+    return reading.replace("ü", "v").title()
+
+
+def _lazy_pinyin_title(word: str) -> List[str]:
+    """Convert a word with pypinyin, keeping the adjusted characters' pinyin.
+
+    Args:
+        word: the word to convert.
+
+    Returns:
+        A list of capitalized pinyin.
+    """
+    pinyins: List[str] = []
+    start = 0
+    for index, char in enumerate(word):
+        if ord(char) in PINYIN_ADJUSTMENTS:
+            if start < index:
+                pinyins.extend(pinyin.title() for pinyin in lazy_pinyin([word[start:index]]))
+            pinyins.append(_fixed_pinyin(char) or char)
+            start = index + 1
+    if start < len(word):
+        pinyins.extend(pinyin.title() for pinyin in lazy_pinyin([word[start:]]))
+    return pinyins
+
+
+@functools.lru_cache(maxsize=None)
+def _pinyin_title(title: str) -> Tuple[str, ...]:
+    """Convert a title to a tuple of capitalized pinyin.
+
+    Words made up of characters with a single reading (the vast majority) are
+    looked up character by character; any other word is handed to pypinyin as a
+    whole, so that polyphonic characters are still resolved in context.
+
+    Args:
+        title: the title to convert.
+
+    Returns:
+        A tuple of each character's (or non-Chinese word's) pinyin.
+    """
+    pinyins: List[str] = []
+    for word in title.split(" "):
+        fixed = [_fixed_pinyin(char) for char in word]
+        if word and all(fixed):
+            pinyins.extend(pinyin for pinyin in fixed if pinyin)
+        else:
+            pinyins.extend(_lazy_pinyin_title(word))
+    return tuple(pinyins)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_search_terms(title: str) -> Tuple[str, str]:
+    """Return the title as it is expected to appear in filenames, and its guard.
+
+    The guard is the search title in full-width parentheses: files like
+    恩典之路（赞美之泉） should not be matched by the song 赞美之泉.
+
+    Args:
+        title: the song title.
+
+    Returns:
+        The search title and the guard.
+    """
+    search_title = title.translate(SEARCH_TITLE_TRANSLATION)
+    return search_title, f"（{search_title}）"
+
+
+@attr.s(auto_attribs=True, slots=True)
 class Song:
     """A song."""
 
@@ -82,7 +242,7 @@ class Song:
         Returns:
             A list of each character's pinyin
         """
-        return [pinyin.title() for pinyin in lazy_pinyin(self.title.split(" "))]
+        return list(_pinyin_title(self.title))
 
     @property
     def title_url(self: T) -> str:
@@ -102,15 +262,23 @@ class Song:
         else:
             return "2"
 
-    def match_file(self: T, filename: str, extensions: List[str]) -> bool:
-        """Match if a filename contains the searched title or one of the extensions."""
-        # to avoid files like 恩典之路（赞美之泉） matched by the song 赞美之泉.
-        search_title = self.title.replace("祢", "你").replace("祂", "他")
-        if search_title in filename and f"（{search_title}）" not in filename:
-            for extension in extensions:
-                if filename.endswith(extension):
-                    return True
-        return False
+    @property
+    def _search_terms(self: T) -> Tuple[str, str]:
+        """Return the title used to match filenames, and its guard."""
+        return _build_search_terms(self.title)
+
+    def match_file(self: T, filename: str, extensions: Sequence[str]) -> bool:
+        """Match if a filename contains the searched title or one of the extensions.
+
+        Pass `extensions` as a tuple when calling in a loop, to avoid converting it
+        on every call.
+        """
+        search_title, guard = self._search_terms
+        return (
+            search_title in filename
+            and guard not in filename
+            and filename.endswith(tuple(extensions))
+        )
 
     def find_resources(
         self: T, resource_type: str, library: str, extension: Optional[str] = None
@@ -136,18 +304,17 @@ class Song:
         if not extension and resource_type not in SongResource.EXTENSIONS:
             raise ValueError(f"Resource type of '{resource_type}' is not supported.")
         self.resources = [] if self.resources is None else self.resources
-        search_extensions = [extension] if extension else SongResource.EXTENSIONS[resource_type]
-        for root, _, files in os.walk(library):
-            for file in files:
-                if self.match_file(filename=file, extensions=search_extensions):
-                    logger.debug(f"Found resource for {self.title}: {os.path.join(root, file)}.")
-                    self.resources.append(
-                        SongResource(
-                            song=self,
-                            type_=resource_type,
-                            location=os.path.join(root, file),
-                        )
-                    )
+        search_extensions = (
+            (extension,) if extension else tuple(SongResource.EXTENSIONS[resource_type])
+        )
+        found = [
+            SongResource(song=self, type_=resource_type, location=location)
+            for _, location, file in _iter_files(library)
+            if self.match_file(filename=file, extensions=search_extensions)
+        ]
+        for resource in found:
+            logger.debug("Found resource for {}: {}.", self.title, resource.location)
+        self.resources.extend(found)
         if not self.resources:
             logger.warning(f"Resource for {self.title} is not found.")
         return True if self.resources else False
@@ -158,32 +325,37 @@ class Song:
             return False
         if subfolder:
             destination = os.path.join(to, self.title)
-            try:
-                os.mkdir(destination)
-            except FileExistsError:
-                logger.debug(f"Sheet folder for {self.title} already existed.")
+            os.makedirs(destination, exist_ok=True)
         else:
             destination = to
         for resource in self.resources:
             if resource.type_ == resource_type:
                 logger.debug(
-                    f"Copying song {resource.song.title} from {resource.location} to {destination}."  # noqa: E501
+                    "Copying song {} from {} to {}.",
+                    resource.song.title,
+                    resource.location,
+                    destination,
+                )
+                # Metadata is not needed, and `copyfile` lets the kernel copy the bytes.
+                shutil.copyfile(
+                    src=resource.location,
+                    dst=os.path.join(destination, os.path.basename(resource.location)),
                 )
-                shutil.copy2(src=resource.location, dst=destination)
         else:
             return True
 
     @property
     def _sheet_links(self: T) -> str:
         """Return a concatenated sheet link string."""
-        sheet_locations = []
         if not self.resources:
             return ""
-        for resource in self.resources:
-            if resource.type_ == "sheet":
-                sheet_location = resource.location.replace("docs/", "/")
-                sheet_locations.append(sheet_location)
-        return ",".join(sorted(sheet_locations))
+        return ",".join(
+            sorted(
+                resource.location.replace("docs/", "/", 1)
+                for resource in self.resources
+                if resource.type_ == "sheet"
+            )
+        )
 
     def check_page_exists(self: T, page_dir: str) -> bool:
         """Check if the song's page exists in `page_dir`."""
@@ -201,19 +373,14 @@ class Song:
         #         return False
         #     else:
         #         raise ValueError(error_message)
-        song_page = os.path.join(page_dir, f"{self.title}.md")
-        with open(song_page, "w") as f:
-            f.write(
-                SONG_PAGE_TEMPLATE.substitute(
-                    title=self.title,
-                    title_url=self.title_url,
-                    sheet_links=self._sheet_links,
-                    data_columns=self._data_columns,
-                )
-            )
-        logger.debug(f"Successfully wrote song page {self.title}.")
+        _write_song_page(self._page_payload(page_dir))
+        logger.debug("Successfully wrote song page {}.", self.title)
         return True
 
+    def _page_payload(self: T, page_dir: str) -> Tuple[str, str, str, str, str]:
+        """Gather everything `_write_song_page` needs into a picklable tuple."""
+        return (self.title, self.title_url, self._sheet_links, self._data_columns, page_dir)
+
 
 S = TypeVar("S", bound="SongList")
 
@@ -283,34 +450,28 @@ class SongList:
     def export_csv(self: S, to: str, legacy: bool = False) -> bool:
         """Export the songlist to a csv file."""
         filenames = self._LEGACY_HEADER if legacy else self._HEADER
-        with open(to, "w") as csv_file:
-            csv_writer = csv.DictWriter(csv_file, fieldnames=filenames)
-            csv_writer.writeheader()
+        with open(to, "w", newline="") as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(filenames)
             if legacy:
-                for song in self.songs:
-                    csv_writer.writerow(
-                        {
-                            "name": song.title,
-                            "key": song.original_key,
-                            "hymn_ref": None,
-                            "sheet_type": None,
-                        }
-                    )
+                csv_writer.writerows(
+                    (song.title, song.original_key, None, None) for song in self.songs
+                )
             else:
-                for song in self.songs:
-                    csv_writer.writerow(
-                        {
-                            "title": song.title,
-                            "alternative_titles": song.alternative_title_string,
-                            "original_key": song.original_key,
-                            "lyricist": song.lyricist,
-                            "composer": song.composer,
-                            "artist": song.artist,
-                            "album": song.album,
-                            "tempo": song.tempo,
-                            "year": song.year,
-                        }
+                csv_writer.writerows(
+                    (
+                        song.title,
+                        song.original_key,
+                        song.alternative_title_string,
+                        song.lyricist,
+                        song.composer,
+                        song.artist,
+                        song.album,
+                        song.tempo,
+                        song.year,
                     )
+                    for song in self.songs
+                )
             return True
 
     def export_song_info(self: S, to: str) -> bool:
@@ -344,20 +505,63 @@ class SongList:
         else:
             raise ValueError(f"Cannot add {songs} ({type(songs)}) to the song list.")
 
+    @staticmethod
+    def _match_resources(
+        songs: List[Song], resource_type: str, library: str, extension: Optional[str] = None
+    ) -> None:
+        """Walk through `library` once and attach matched resources to `songs`."""
+        if not extension and resource_type not in SongResource.EXTENSIONS:
+            raise ValueError(f"Resource type of '{resource_type}' is not supported.")
+        exts = tuple([extension] if extension else SongResource.EXTENSIONS[resource_type])
+        song_resources: List[Tuple[Song, List[SongResource]]] = []
+        for song in songs:
+            resources = song.resources = song.resources or []
+            song_resources.append((song, resources))
+        for _, location, file in _iter_files(library):
+            if not file.endswith(exts):
+                continue
+            for song, resources in song_resources:
+                if song.match_file(filename=file, extensions=exts):
+                    logger.debug("Found resource for {}: {}.", song.title, location)
+                    resources.append(
+                        SongResource(song=song, type_=resource_type, location=location)
+                    )
+        for song in songs:
+            if not song.resources:
+                logger.warning(f"Resource for {song.title} is not found.")
+
     def find_resources(
         self: S, resource_type: str, library: str, extension: Optional[str] = None
     ) -> bool:
         """Find resources for every song in the list."""
-        for song in self.songs:
-            song.find_resources(resource_type, library, extension)
+        return self.find_resources_bulk(resource_type, library, extension)
+
+    def find_resources_bulk(
+        self: S, resource_type: str, library: str, extension: Optional[str] = None
+    ) -> bool:
+        """Find resources for every song in the list with a single walk of `library`.
+
+        Args:
+            resource_type: "sheet" or "media".
+            library: the path to search in.
+            extension: match the extension if provided, otherwise a list of default
+                extensions will be matched based on `resource_type`.
+
+        Returns:
+            True when the search is done.
+        """
+        self._match_resources(self.songs, resource_type, library, extension)
         return True
 
     def find_resources_in_subfolder(
         self: S, resource_type: str, library: str, extension: Optional[str] = None
     ) -> bool:
         """Find resources for every song in the list."""
+        subfolders: Dict[str, List[Song]] = {}
         for song in self.songs:
-            song.find_resources(resource_type, os.path.join(library, song.title), extension)
+            subfolders.setdefault(os.path.join(library, song.title), []).append(song)
+        for subfolder, songs in subfolders.items():
+            self._match_resources(songs, resource_type, subfolder, extension)
         return True
 
     def move_resources(self: S, to: str, resource_type: str, subfolder: bool = True) -> bool:
@@ -369,10 +573,31 @@ class SongList:
         else:
             return True
 
-    def create_pages(self: S, page_dir: str, quiet: bool = False) -> bool:
-        """Create a song page for all songs in the song list."""
-        for song in self.songs:
-            song.create_page(page_dir=page_dir, quiet=quiet)
+    def create_pages(
+        self: S, page_dir: str, quiet: bool = False, max_workers: Optional[int] = None
+    ) -> bool:
+        """Create a song page for all songs in the song list.
+
+        Pages are written one after another by default: each one is a small
+        render and write, too little work to pay for starting a pool.
+
+        Args:
+            page_dir: the directory to write the pages to.
+            quiet: unused, kept for symmetry with `Song.create_page`.
+            max_workers: write the pages in a pool of this many threads, e.g. when
+                `page_dir` is on a slow or network file system.
+
+        Returns:
+            True when all pages are written.
+        """
+        payloads = [song._page_payload(page_dir) for song in self.songs]
+        if max_workers and max_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                titles = list(executor.map(_write_song_page, payloads))
+        else:
+            titles = [_write_song_page(payload) for payload in payloads]
+        for title in titles:
+            logger.debug("Successfully wrote song page {}.", title)
         return True
 
     @classmethod
@@ -393,35 +618,37 @@ class SongList:
         """
         songs = []
         header = cls._LEGACY_HEADER if legacy else cls._HEADER
-        with open(csv_file_path) as csv_file:
-            csv_reader = csv.DictReader(csv_file)
-            for line_count, row in enumerate(csv_reader):
-                if line_count == 0:
-                    if list(row.keys()) != header:
-                        raise ValueError(f"Invalid csv header: {row.keys()}")
-                    else:
-                        logger.debug("The csv header is correctly read.")
+        with open(csv_file_path, newline="") as csv_file:
+            csv_reader = csv.reader(csv_file)
+            row = next(csv_reader, header)
+            if row != header:
+                raise ValueError(f"Invalid csv header: {row}")
+            logger.debug("The csv header is correctly read.")
+            for row in csv_reader:
+                if not row:
+                    continue
+                # Missing trailing fields are None, as with `csv.DictReader`.
+                fields: List[Optional[str]] = [*row, *[None] * (len(header) - len(row))]
                 if legacy:
-                    songs.append(Song(title=row["name"], original_key=row["key"]))
+                    songs.append(Song(title=row[0], original_key=fields[1]))
                 else:
                     songs.append(
                         Song(
-                            title=row["title"],
-                            original_key=row["original_key"],
-                            alternative_titles=row["alternative_titles"],
-                            lyricist=row["lyricist"],
-                            composer=row["composer"],
-                            artist=row["artist"],
-                            album=row["album"],
-                            tempo=row["tempo"],
-                            year=row["year"],
+                            title=row[0],
+                            original_key=fields[1],
+                            alternative_titles=fields[2],
+                            lyricist=fields[3],
+                            composer=fields[4],
+                            artist=fields[5],
+                            album=fields[6],
+                            tempo=fields[7],
+                            year=fields[8],
                         )
                     )
-                    logger.debug(f"Added song {row['title']}")
         return cls(name=Path(csv_file_path).name, songs=songs)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class SongResource:
     """A music sheet or a media file for a song.
 
@@ -449,25 +676,21 @@ class SongResource:
     album: Optional[str] = None
 
 
+# Extensions searched by `find` and `find_multiple`; sheets must also be in a TINY folder.
+FIND_EXTENSIONS: Dict[str, Tuple[str, ...]] = {"sheet": (".png",), "media": (".mp3",)}
+
+
 def find(title: str, what: str, path: str) -> Union[List[str], bool]:
     """Find a song in path."""
-    if what not in ["sheet", "media"]:
+    if what not in FIND_EXTENSIONS:
         raise ValueError(f"Only `sheet` and `media` are supported, not {what}.")
+    exts = FIND_EXTENSIONS[what]
+    tiny_only = what == "sheet"
     results = []
-    for dirpath, _, files in os.walk(path):
-        for filename in files:
-            if what == "sheet":
-                if title in filename and filename.endswith(".png") and "TINY" in dirpath:
-                    found_path = os.path.join(dirpath, filename)
-                    print(found_path)
-                    results.append(found_path)
-            elif what == "media":
-                if title in filename and filename.endswith(".mp3"):
-                    found_path = os.path.join(dirpath, filename)
-                    print(found_path)
-                    results.append(found_path)
-            else:
-                pass
+    for dirpath, found_path, filename in _iter_files(path):
+        if filename.endswith(exts) and title in filename and (not tiny_only or "TINY" in dirpath):
+            print(found_path)
+            results.append(found_path)
     if not results:
         print(f"no results found for {title} in {path}")
         return False
@@ -475,22 +698,57 @@ def find(title: str, what: str, path: str) -> Union[List[str], bool]:
 
 
 def find_multiple(what: str, path: str, song_list: SongList) -> Union[List[str], bool]:
-    """Find multiple _songs in a song list."""
-    results = []
-    for dirpath, _, files in os.walk(path):
-        for filename in files:
-            for song in song_list.songs:
-                if song.title in filename and f"（{song.title}）" not in filename:
-                    if (what == "sheet" and filename.endswith(".png") and "TINY" in dirpath) or (
-                        what == "media" and filename.endswith(".mp3")
-                    ):
-                        found_path = os.path.join(dirpath, filename)
-                        print(song.title)
-                        print(found_path)
-                        results.append(found_path)
+    """Find multiple _songs in a song list.
+
+    All titles are searched at once with an Aho-Corasick automaton, so each
+    filename is scanned a single time no matter how many songs are in the list.
+    """
+    results: List[str] = []
+    if what not in FIND_EXTENSIONS:
+        return results
+    exts = FIND_EXTENSIONS[what]
+    tiny_only = what == "sheet"
+    automaton = ahocorasick.Automaton()
+    for song in song_list.songs:
+        if song.title:
+            automaton.add_word(song.title, song.title)
+    if not len(automaton):
+        return results
+    automaton.make_automaton()
+    songs_by_title: Dict[str, List[Song]] = {}
+    for song in song_list.songs:
+        songs_by_title.setdefault(song.title, []).append(song)
+    for dirpath, found_path, filename in _iter_files(path):
+        if not filename.endswith(exts) or (tiny_only and "TINY" not in dirpath):
+            continue
+        matched_titles = dict.fromkeys(title for _, title in automaton.iter(filename))
+        for title in matched_titles:
+            if f"（{title}）" in filename:
+                continue
+            for song in songs_by_title[title]:
+                print(song.title)
+                print(found_path)
+                results.append(found_path)
     return results
 
 
+def _process_song(song: Song, library: str, page_dir: str, extension: str) -> Song:
+    """Find a song's sheets in its subfolder of `library` and write its page.
+
+    Args:
+        song: the song to process.
+        library: the sheet library, with one subfolder per song title.
+        page_dir: the directory to write the page to.
+        extension: the extension of the sheets.
+
+    Returns:
+        The song with its resources filled in.
+    """
+    song.find_resources("sheet", os.path.join(library, song.title), extension)
+    song.create_page(page_dir=page_dir)
+    return song
+
+
 if __name__ == "__main__":
     # import subprocess  # noqa
     # from pprint import pprint
@@ -499,11 +757,20 @@ if __name__ == "__main__":
     SHEET_LIB = "/Users/kip/Mercury/3.Ecclasia/4. 灵栖清泉"
     MUSIC_LIB = "/Volumes/music"
     DOCS_SHEET_LIB = "docs/library/sheet"
+    # Only worth it for libraries far larger than the songbook: for a few hundred
+    # songs, starting the pool costs more than the work it spreads out.
+    USE_POOL = False
     song_list = SongList.from_csv(csv_file_path="docs/_data/songs.csv", legacy=False)
-    song_list.find_resources_in_subfolder("sheet", DOCS_SHEET_LIB, "png")
+    process_song = functools.partial(
+        _process_song, library=DOCS_SHEET_LIB, page_dir="docs/song/", extension="png"
+    )
+    if USE_POOL:
+        with multiprocessing.Pool() as pool:
+            song_list.songs = pool.map(process_song, song_list.songs, chunksize=16)
+    else:
+        song_list.songs = [process_song(song) for song in song_list.songs]
     # song_list.move_resources(to="docs/library/sheet", resource_type="sheet")
     # song = song_list.songs[-2]
-    song_list.create_pages("docs/song/")
     # song.find_resources("sheet", library=SHEET_LIB, extension=".png")
     # song.move_resources(to="docs/library/sheet/", resource_type="sheet")
     # song_list = SongList.from_csv(csv_file_path="docs/_data/all_songs.csv", legacy=False)
@@ -1,9 +1,11 @@
 """Tests for `legoworship` module."""
+from pathlib import Path
 from typing import Generator
 
 import pytest
 
 from legoworship import Song, SongList, __version__
+from legoworship.legoworship import SongResource, _process_song, find, find_multiple
 
 
 @pytest.fixture
@@ -57,3 +59,184 @@ def test_songlist_sort_by_key() -> None:
     assert [song_1, song_2] == SongList(name="Test", songs=[song_1, song_2]).sort(
         by="original_key"
     ).songs
+
+
+def test_song_pinyin_title_adjusted() -> None:
+    """Adjusted characters use our pronunciation, with or without neighbours."""
+    assert Song(title="祢").pinyin_title == ["Ni"]
+    assert Song(title="祢是").pinyin_title == ["Ni", "Shi"]
+    assert Song(title="因祢与我同行").pinyin_title == ["Yin", "Ni", "Yu", "Wo", "Tong", "Xing"]
+
+
+def test_song_pinyin_title_polyphonic() -> None:
+    """Words with polyphonic characters are read as pypinyin reads them."""
+    assert Song(title="与我同行").pinyin_title == ["Yu", "Wo", "Tong", "Xing"]
+    assert Song(title="我愿降服").pinyin_title == ["Wo", "Yuan", "Jiang", "Fu"]
+
+
+def test_songlist_find_resources_bulk(tmp_path: Path) -> None:
+    """Resources of all songs are found in a single walk of the library."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "赞美之泉.png").touch()
+    (tmp_path / "sub" / "恩典之路（赞美之泉）.png").touch()
+    (tmp_path / "sub" / "恩典之路.pdf").touch()
+    (tmp_path / "恩典之路.mp3").touch()
+    song_1 = Song(title="赞美之泉")
+    song_2 = Song(title="恩典之路")
+    song_3 = Song(title="不存在")
+    assert SongList(name="Test", songs=[song_1, song_2, song_3]).find_resources_bulk(
+        "sheet", str(tmp_path)
+    )
+    assert song_1.resources is not None and song_2.resources is not None
+    assert [r.location for r in song_1.resources] == [str(tmp_path / "赞美之泉.png")]
+    assert sorted(r.location for r in song_2.resources) == [
+        str(tmp_path / "sub" / "恩典之路.pdf"),
+        str(tmp_path / "sub" / "恩典之路（赞美之泉）.png"),
+    ]
+    assert song_3.resources == []
+
+
+def test_song_find_resources_nested(tmp_path: Path) -> None:
+    """Files in nested folders are found, and missing libraries are skipped."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "测试.png").touch()
+    song = Song(title="测试")
+    assert song.find_resources("sheet", str(tmp_path))
+    assert song.resources is not None
+    assert [r.location for r in song.resources] == [str(tmp_path / "a" / "b" / "测试.png")]
+    assert not Song(title="测试").find_resources("sheet", str(tmp_path / "missing"))
+
+
+def test_find_multiple(tmp_path: Path) -> None:
+    """Every song title contained in a filename is matched."""
+    (tmp_path / "TINY").mkdir()
+    (tmp_path / "TINY" / "一生爱你.png").touch()
+    (tmp_path / "TINY" / "恩典之路（赞美之泉）.png").touch()
+    (tmp_path / "赞美之泉.png").touch()
+    song_list = SongList(
+        name="Test", songs=[Song(title="爱你"), Song(title="一生爱你"), Song(title="赞美之泉")]
+    )
+    assert find_multiple("sheet", str(tmp_path), song_list) == [
+        str(tmp_path / "TINY" / "一生爱你.png"),
+        str(tmp_path / "TINY" / "一生爱你.png"),
+    ]
+    assert find_multiple("sheet", str(tmp_path), SongList(name="Empty", songs=[])) == []
+
+
+def test_song_match_file() -> None:
+    """Filenames match on the search title, guard and extension."""
+    song = Song(title="祢是我的主")
+    assert song.match_file("你是我的主.png", (".png", ".pdf"))
+    assert song.match_file("你是我的主.pdf", [".png", ".pdf"])
+    assert not song.match_file("你是我的主.mp3", (".png", ".pdf"))
+    assert not song.match_file("歌（你是我的主）.png", (".png",))
+
+
+def test_song_slots() -> None:
+    """Songs do not carry an instance dictionary."""
+    song = Song(title="测试")
+    assert not hasattr(song, "__dict__")
+    with pytest.raises(AttributeError):
+        song.undeclared = True  # type: ignore[attr-defined]
+
+
+def test_song_create_page(tmp_path: Path) -> None:
+    """The song page links to every sheet of the song."""
+    song = Song(title="测试 歌曲")
+    song.resources = [
+        SongResource(song=song, type_="sheet", location="docs/library/sheet/测试/2.png"),
+        SongResource(song=song, type_="sheet", location="docs/library/sheet/测试/1.png"),
+    ]
+    assert song.create_page(page_dir=str(tmp_path))
+    page = (tmp_path / "测试 歌曲.md").read_text()
+    assert "permalink: /songbook/测试+歌曲\n" in page
+    assert "    columns = 2\n" in page
+    assert '    images = "/library/sheet/测试/1.png,/library/sheet/测试/2.png,"\n' in page
+    assert "{% include post-components/gallery.html\n" in page
+
+
+def test_song_move_resources(tmp_path: Path) -> None:
+    """Resources of the given type are copied into the song's subfolder."""
+    (tmp_path / "library").mkdir()
+    (tmp_path / "library" / "测试.png").write_bytes(b"sheet")
+    (tmp_path / "library" / "测试.mp3").write_bytes(b"media")
+    song = Song(title="测试")
+    song.find_resources("sheet", str(tmp_path / "library"), ".png")
+    song.find_resources("media", str(tmp_path / "library"))
+    for _ in range(2):
+        assert song.move_resources(to=str(tmp_path), resource_type="sheet")
+    assert [p.name for p in (tmp_path / "测试").iterdir()] == ["测试.png"]
+    assert (tmp_path / "测试" / "测试.png").read_bytes() == b"sheet"
+
+
+def test_songlist_create_pages(tmp_path: Path) -> None:
+    """A page is written for every song in the list."""
+    songs = [Song(title=f"歌曲{i}", resources=[]) for i in range(3)]
+    for max_workers in (None, 2):
+        page_dir = tmp_path / str(max_workers)
+        page_dir.mkdir()
+        assert SongList(name="Test", songs=songs).create_pages(
+            str(page_dir), max_workers=max_workers
+        )
+        assert sorted(p.name for p in page_dir.iterdir()) == ["歌曲0.md", "歌曲1.md", "歌曲2.md"]
+
+
+def test_songlist_export_csv(tmp_path: Path) -> None:
+    """Exported rows follow the header order."""
+    song = Song(title="测试", original_key="C", alternative_titles=["Test", "Essai"], year=2021)
+    to = tmp_path / "songs.csv"
+    assert SongList(name="Test", songs=[song]).export_csv(to=str(to))
+    assert to.read_text().splitlines() == [
+        ",".join(SongList._HEADER),
+        "测试,C,Test / Essai,,,,,,2021",
+    ]
+    assert SongList(name="Test", songs=[song]).export_csv(to=str(to), legacy=True)
+    assert to.read_text().splitlines() == ["name,key,hymn_ref,sheet_type", "测试,C,,"]
+
+
+def test_songlist_from_csv(tmp_path: Path) -> None:
+    """Songs are read back from an exported csv file."""
+    csv_file = tmp_path / "songs.csv"
+    csv_file.write_text(",".join(SongList._HEADER) + "\n测试,C,,,,,,,2021\n\n短行,D\n")
+    song_list = SongList.from_csv(str(csv_file))
+    assert song_list.name == "songs.csv"
+    assert [(song.title, song.original_key, song.year) for song in song_list.songs] == [
+        ("测试", "C", "2021"),
+        ("短行", "D", None),
+    ]
+
+
+def test_songlist_from_csv_invalid_header(tmp_path: Path) -> None:
+    """A csv file with the wrong header is rejected."""
+    csv_file = tmp_path / "songs.csv"
+    csv_file.write_text("name,key,hymn_ref,sheet_type\n测试,C,,\n")
+    with pytest.raises(ValueError):
+        SongList.from_csv(str(csv_file))
+    assert SongList.from_csv(str(csv_file), legacy=True).songs == [
+        Song(title="测试", original_key="C")
+    ]
+
+
+def test_process_song(tmp_path: Path) -> None:
+    """A song's sheets are found in its subfolder and its page is written."""
+    (tmp_path / "library" / "测试").mkdir(parents=True)
+    (tmp_path / "library" / "测试" / "测试.png").touch()
+    song = _process_song(Song(title="测试"), str(tmp_path / "library"), str(tmp_path), "png")
+    assert song.resources is not None
+    assert [r.location for r in song.resources] == [
+        str(tmp_path / "library" / "测试" / "测试.png")
+    ]
+    assert (tmp_path / "测试.md").is_file()
+
+
+def test_find(tmp_path: Path) -> None:
+    """Sheets are only found in TINY folders, media anywhere."""
+    (tmp_path / "TINY").mkdir()
+    (tmp_path / "TINY" / "测试.png").touch()
+    (tmp_path / "测试.png").touch()
+    (tmp_path / "测试.mp3").touch()
+    assert find("测试", "sheet", str(tmp_path)) == [str(tmp_path / "TINY" / "测试.png")]
+    assert find("测试", "media", str(tmp_path)) == [str(tmp_path / "测试.mp3")]
+    assert find("其他", "media", str(tmp_path)) is False
+    with pytest.raises(ValueError):
+        find("测试", "lyrics", str(tmp_path))